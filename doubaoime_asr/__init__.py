@@ -12,6 +12,7 @@ from .asr import (
     transcribe,
     transcribe_stream,
     transcribe_realtime,
+    uvloop_loop_factory,
 )
 from .config import ASRConfig
 from .ner import NerResponse, NerResult, NerWord, ner
@@ -31,6 +32,7 @@ __all__ = [
     "transcribe",
     "transcribe_stream",
     "transcribe_realtime",
+    "uvloop_loop_factory",
     "NerResponse",
     "NerResult",
     "NerWord",
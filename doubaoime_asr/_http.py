@@ -0,0 +1,36 @@
+"""
+HTTP 会话
+
+设备注册、Token 获取、NER 等接口共用一个 `requests.Session`，
+复用连接池中的 keep-alive 连接，避免每次请求都重新建立 TCP/TLS 连接。
+
+这些请求可能属于不同的设备/配置，因此会话不保存任何 Cookie，
+请求之间除连接池外不共享状态。
+
+线程模型：`requests.Session` 未声明线程安全，模块级 `session` 按单线程使用设计；
+需要在其他线程中发起请求的组件（如 `WaveClient` 的握手）应通过 `new_session()`
+持有独立的会话。
+"""
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .constants import USER_AGENT
+
+
+def new_session(pool_connections: int = 4, pool_maxsize: int = 8) -> requests.Session:
+    """
+    创建带连接池、不保存 Cookie 的会话
+    """
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    s.headers["User-Agent"] = USER_AGENT
+    # 拒绝所有域名的 Set-Cookie，避免一个设备的 Cookie 被带到其他设备的请求中
+    s.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return s
+
+
+session = new_session()
@@ -0,0 +1,43 @@
+"""
+JSON 编解码
+
+安装了 orjson 时优先使用（见 `speedups` 可选依赖），否则回退到标准库 json。
+编码结果统一为 UTF-8 bytes，不转义非 ASCII 字符。
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson.JSONDecodeError 是它的子类
+JSONDecodeError = json.JSONDecodeError
+
+
+if orjson is not None:
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """
+        :param indent: 是否以 2 空格缩进输出（用于写入文件）
+        """
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+else:
+    def loads(data: Union[str, bytes, bytearray, memoryview]) -> Any:
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def dumps(obj: Any, *, indent: bool = False) -> bytes:
+        """
+        :param indent: 是否以 2 空格缩进输出（用于写入文件）
+        """
+        if indent:
+            text = json.dumps(obj, indent=2, ensure_ascii=False)
+        else:
+            text = json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+        return text.encode()
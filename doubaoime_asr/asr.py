@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import contextlib
 from dataclasses import dataclass, field
 from enum import Enum, auto
-import json
 from pathlib import Path
+import socket
 import time
 from typing import AsyncIterator, Callable, List, Optional, Union
 import uuid
@@ -13,7 +14,8 @@ from pydantic import BaseModel, Field
 import websockets
 from websockets import ClientConnection
 
-from .config import ASRConfig, SessionConfig
+from . import _json
+from .config import ASRConfig
 from .audio import AudioEncoder
 from .asr_pb2 import AsrRequest, AsrResponse as AsrResponsePb, FrameState
 
@@ -32,6 +34,10 @@ class ResponseType(Enum):
     INTERIM_RESULT = auto()
     FINAL_RESULT = auto()
     HEARTBEAT = auto()
+    """
+    心跳包，仅用于重置接收超时，不会转发给用户；
+    只携带 type，其余字段（packet_number、raw_json、extra 等）均为默认值
+    """
     ERROR = auto()
     UNKNOWN = auto()
 
@@ -123,6 +129,9 @@ class _SessionState(BaseModel):
     final_text: str = ""
     is_finished: bool = False
     error: Optional[ASRResponse] = None
+    # 会话内不变的控制消息，在 `_initialize_session` 中构建一次
+    start_task_bytes: Optional[bytes] = None
+    finish_session_bytes: Optional[bytes] = None
 
 
 class DoubaoASR:
@@ -185,41 +194,47 @@ class DoubaoASR:
                 async for resp in self._initialize_session(ws, state):
                     yield resp
 
-                # 响应队列
-                response_queue: asyncio.Queue[Optional[ASRResponse]] = asyncio.Queue()
+                # 响应通道
+                responses = _ResponseChannel()
 
                 # 启动发送和接收任务
                 send_task = asyncio.create_task(
                     self._send_audio(ws, opus_frames, state, realtime)
                 )
                 recv_task = asyncio.create_task(
-                    self._receive_responses(ws, state, response_queue)
+                    self._receive_responses(ws, state, responses)
                 )
 
+                # 等待响应超时后关闭响应通道，整个会话共用一个定时器
+                idle_timer = None
+                if self.config.recv_timeout is not None:
+                    idle_timer = _IdleTimer(self.config.recv_timeout, responses)
+
                 try:
-                    # 从队列中获取服务器响应
+                    # 从通道中获取服务器响应
                     while True:
-                        try:
-                            resp = await asyncio.wait_for(
-                                response_queue.get(),
-                                timeout=self.config.recv_timeout,
-                            )
-                            if resp is None: # 结束标记
-                                break
-
-                            # 心跳包仅用于重置超时，不转发给用户
-                            if resp.type == ResponseType.HEARTBEAT:
-                                continue
-
-                            yield resp
-                            if resp.type == ResponseType.ERROR:
-                                break
-
-                        except asyncio.TimeoutError:
+                        if idle_timer:
+                            idle_timer.start_waiting()
+                        has_more = await responses.wait()
+                        if idle_timer:
+                            idle_timer.stop_waiting()
+
+                        if not has_more: # 通道已关闭（接收结束或等待超时）
+                            break
+                        resp = responses.popleft()
+
+                        # 心跳包仅用于重置超时，不转发给用户
+                        if resp.type == ResponseType.HEARTBEAT:
+                            continue
+
+                        yield resp
+                        if resp.type == ResponseType.ERROR:
                             break
 
                     await send_task
                 finally:
+                    if idle_timer:
+                        idle_timer.cancel()
                     send_task.cancel()
                     recv_task.cancel()
                     with contextlib.suppress(asyncio.CancelledError):
@@ -255,23 +270,21 @@ class DoubaoASR:
                 async for resp in self._initialize_session(ws, state):
                     yield resp
 
-                # 响应队列
-                response_queue: asyncio.Queue[Optional[ASRResponse]] = asyncio.Queue()
+                # 响应通道
+                responses = _ResponseChannel()
 
                 # 启动发送和接收任务
                 send_task = asyncio.create_task(
                     self._send_audio_realtime(ws, audio_source, state)
                 )
                 recv_task = asyncio.create_task(
-                    self._receive_responses(ws, state, response_queue)
+                    self._receive_responses(ws, state, responses)
                 )
 
                 try:
                     # 实时模式不使用超时，依靠 WebSocket 层检测断开
-                    while True:
-                        resp = await response_queue.get()
-                        if resp is None:
-                            break
+                    while await responses.wait():
+                        resp = responses.popleft()
 
                         if resp.type == ResponseType.HEARTBEAT:
                             continue
@@ -300,56 +313,67 @@ class DoubaoASR:
     ):
         """
         从异步迭代器读取 PCM 数据并实时发送
+
+        读取和发送分为两个任务：`_collect_pcm` 持续读取音频源并切分出完整帧，
+        当前任务负责编码和发送，两者通过有界队列连接，
+        音频输入不会被编码/发送阻塞，发送过慢时也能对输入形成背压。
         """
         timestamp_ms = int(time.time() * 1000)
+        template = _new_task_request_template(state.request_id)
         frame_index = 0
-        pcm_buffer = b""
-
-        samples_per_frame = (
-            self.config.sample_rate * self.config.frame_duration_ms // 1000
-        )
-        bytes_per_frame = samples_per_frame * 2  # 16-bit
-
-        async for chunk in audio_source:
-            if state.is_finished:
-                break
-
-            pcm_buffer += chunk
+        bytes_per_frame = self.config.bytes_per_frame
 
-            # 当缓冲区有足够数据时，编码并发送
-            while len(pcm_buffer) >= bytes_per_frame:
-                pcm_frame = pcm_buffer[:bytes_per_frame]
-                pcm_buffer = pcm_buffer[bytes_per_frame:]
+        pcm_buffer = bytearray()
 
-                # 编码为 Opus
-                opus_frame = self._encoder.encoder.encode(pcm_frame, samples_per_frame)
+        pcm_queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue(maxsize=64)
+        collect_task = asyncio.create_task(
+            self._collect_pcm(audio_source, state, pcm_queue)
+        )
 
-                # 确定帧状态（实时模式下不知道最后一帧，使用 FIRST/MIDDLE）
-                if frame_index == 0:
-                    frame_state = FrameState.FRAME_STATE_FIRST
-                else:
-                    frame_state = FrameState.FRAME_STATE_MIDDLE
+        try:
+            while not state.is_finished:
+                pcm_frames = await pcm_queue.get()
+                if pcm_frames is None: # 音频源结束
+                    # 不足一帧的剩余数据（音频源出错时在此抛出）
+                    pcm_buffer = await collect_task
+                    break
 
-                msg = _build_asr_request(
-                    opus_frame,
-                    state.request_id,
-                    frame_state,
-                    timestamp_ms + frame_index * self.config.frame_duration_ms,
-                )
-                await ws.send(msg)
-                frame_index += 1
+                # 在线程中编码为 Opus，避免阻塞事件循环（期间仍可接收响应）
+                opus_frames = await asyncio.to_thread(self._encoder.pcm_to_opus_frames, pcm_frames)
+
+                for opus_frame in opus_frames:
+                    # 确定帧状态（实时模式下不知道最后一帧，使用 FIRST/MIDDLE）
+                    if frame_index == 0:
+                        frame_state = FrameState.FRAME_STATE_FIRST
+                    else:
+                        frame_state = FrameState.FRAME_STATE_MIDDLE
+
+                    msg = _build_asr_request(
+                        template,
+                        opus_frame,
+                        frame_state,
+                        timestamp_ms + frame_index * self.config.frame_duration_ms,
+                    )
+                    await ws.send(msg)
+                    frame_index += 1
+        finally:
+            collect_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await collect_task
 
         # 迭代器结束，处理剩余数据
         if pcm_buffer and not state.is_finished:
             # 补零到完整帧
             if len(pcm_buffer) < bytes_per_frame:
-                pcm_buffer += b"\x00" * (bytes_per_frame - len(pcm_buffer))
+                pcm_buffer.extend(b"\x00" * (bytes_per_frame - len(pcm_buffer)))
 
-            opus_frame = self._encoder.encoder.encode(pcm_buffer, samples_per_frame)
+            opus_frame = self._encoder.encoder.encode(
+                bytes(pcm_buffer), self.config.samples_per_frame,
+            )
 
             msg = _build_asr_request(
+                template,
                 opus_frame,
-                state.request_id,
                 FrameState.FRAME_STATE_LAST,
                 timestamp_ms + frame_index * self.config.frame_duration_ms,
             )
@@ -357,12 +381,9 @@ class DoubaoASR:
         elif frame_index > 0 and not state.is_finished:
             # 没有剩余数据，但需要发送一个 LAST 帧标记
             # 发送一个空的 LAST 帧（静音）
-            silent_frame = b"\x00" * bytes_per_frame
-            opus_frame = self._encoder.encoder.encode(silent_frame, samples_per_frame)
-
             msg = _build_asr_request(
-                opus_frame,
-                state.request_id,
+                template,
+                self._encoder.silent_opus_frame,
                 FrameState.FRAME_STATE_LAST,
                 timestamp_ms + frame_index * self.config.frame_duration_ms,
             )
@@ -370,27 +391,86 @@ class DoubaoASR:
 
         # FinishSession
         if not state.is_finished:
-            await ws.send(_build_finish_session(state.request_id, self.config.get_token()))
+            await ws.send(state.finish_session_bytes)
+
+    async def _collect_pcm(
+        self,
+        audio_source: AsyncIterator[AudioChunk],
+        state: _SessionState,
+        queue: asyncio.Queue[Optional[bytes]],
+    ) -> bytearray:
+        """
+        读取音频源，将凑满的完整帧放入队列，结束时放入 None
+
+        :return: 音频源结束后不足一帧的剩余数据
+        """
+        # 使用 bytearray 原地追加/删除，避免 bytes 拼接和切片带来的反复拷贝
+        pcm_buffer = bytearray()
+        bytes_per_frame = self.config.bytes_per_frame
+
+        try:
+            async for chunk in audio_source:
+                if state.is_finished:
+                    break
+
+                if not pcm_buffer and type(chunk) is bytes:
+                    # 缓冲区为空时直接从 chunk 中取出完整帧，只把不足一帧的部分放入缓冲区
+                    # （音频源按帧长分块时完全不经过缓冲区）
+                    ready_bytes = len(chunk) // bytes_per_frame * bytes_per_frame
+                    if ready_bytes == len(chunk):
+                        pcm_frames = chunk
+                    else:
+                        with memoryview(chunk) as view:
+                            pcm_frames = bytes(view[:ready_bytes])
+                            pcm_buffer.extend(view[ready_bytes:])
+                else:
+                    pcm_buffer.extend(chunk)
+
+                    # 当缓冲区有足够数据时，取出所有完整帧
+                    ready_bytes = len(pcm_buffer) // bytes_per_frame * bytes_per_frame
+                    # 通过 memoryview 只拷贝一次
+                    with memoryview(pcm_buffer) as view:
+                        pcm_frames = bytes(view[:ready_bytes])
+                    del pcm_buffer[:ready_bytes]
+
+                if pcm_frames:
+                    await queue.put(pcm_frames)
+        except Exception:
+            # 音频源出错，立即唤醒发送端（队列已满时丢弃一项腾出位置）
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)
+            raise
+
+        # 结束信号
+        await queue.put(None)
+        return pcm_buffer
     
     async def _initialize_session(self, ws: ClientConnection, state: _SessionState) -> AsyncIterator[ASRResponse]:
         """
         初始化 ASR 会话
         """
         token = self.config.get_token()
+        if state.start_task_bytes is None:
+            state.start_task_bytes = _build_start_task(state.request_id, token)
+            state.finish_session_bytes = _build_finish_session(state.request_id, token)
 
-        # StartTask
-        await ws.send(_build_start_task(state.request_id, token))
-        resp = await ws.recv()
+        # StartTask 和 StartSession 连续发送，不等待 TaskStarted，省去一个 RTT
+        # 注意不能用 ws.send([...])，那会把两条消息合并为一条分片消息
+        await ws.send(state.start_task_bytes)
+        await ws.send(
+            _build_start_session(state.request_id, token, self.config.session_config_json)
+        )
+
+        # StartTask 响应
+        resp = await ws.recv(decode=False)
         parsed = _parse_response(resp)
         if parsed.type == ResponseType.ERROR:
             raise ASRError(f'StartTask 失败：{parsed.error_msg}', parsed)
         yield parsed
 
-        # StartSession
-        await ws.send(
-            _build_start_session(state.request_id, token, self.config.session_config())
-        )
-        resp = await ws.recv()
+        # StartSession 响应
+        resp = await ws.recv(decode=False)
         parsed = _parse_response(resp)
         if parsed.type == ResponseType.ERROR:
             raise ASRError(f'StartSession 失败：{parsed.error_msg}', parsed)
@@ -407,73 +487,173 @@ class DoubaoASR:
         发送音频帧
         """
         timestamp_ms = int(time.time() * 1000)
+        template = _new_task_request_template(state.request_id)
         frame_interval = self.config.frame_duration_ms / 1000.0
 
-        for i, opus_frame in enumerate(opus_frames):
-            if state.is_finished:
-                break
-
-            if i == 0:
-                frame_state = FrameState.FRAME_STATE_FIRST
-            elif i == len(opus_frames) - 1:
-                frame_state = FrameState.FRAME_STATE_LAST
-            else:
-                frame_state = FrameState.FRAME_STATE_MIDDLE
-            
-            msg = _build_asr_request(
-                opus_frame,
-                state.request_id,
-                frame_state,
-                timestamp_ms + i * self.config.frame_duration_ms,
-            )
-            await ws.send(msg)
+        # 非实时模式会连续发送大量小帧（每帧一条 ws 消息，协议不允许合并），
+        # 发送期间 cork 住连接，让内核把多帧合并为完整的 TCP 报文；
+        # 连接本身保持 asyncio 默认的 TCP_NODELAY，cork 之外（会话初始化、FinishSession）的消息立即发出
+        corked = not realtime and _set_tcp_cork(ws, True)
+        try:
+            for i, opus_frame in enumerate(opus_frames):
+                if state.is_finished:
+                    break
+
+                if i == 0:
+                    frame_state = FrameState.FRAME_STATE_FIRST
+                elif i == len(opus_frames) - 1:
+                    frame_state = FrameState.FRAME_STATE_LAST
+                else:
+                    frame_state = FrameState.FRAME_STATE_MIDDLE
+
+                msg = _build_asr_request(
+                    template,
+                    opus_frame,
+                    frame_state,
+                    timestamp_ms + i * self.config.frame_duration_ms,
+                )
+                await ws.send(msg)
+
+                if realtime:
+                    await asyncio.sleep(frame_interval)
+        finally:
+            # 取消 cork 会立即冲刷剩余数据
+            if corked:
+                _set_tcp_cork(ws, False)
 
-            if realtime:
-                await asyncio.sleep(frame_interval)
-        
         # FinishSession
-        await ws.send(_build_finish_session(state.request_id, self.config.get_token()))
+        await ws.send(state.finish_session_bytes)
     
     async def _receive_responses(
         self,
         ws: ClientConnection,
         state: _SessionState,
-        queue: asyncio.Queue[Optional[ASRResponse]],
+        responses: _ResponseChannel,
     ):
         """
-        接受响应并放入队列
+        接受响应并放入响应通道
         """
         try:
             while not state.is_finished:
-                response = await ws.recv()
+                response = await ws.recv(decode=False)
                 resp = _parse_response(response)
 
                 if resp.type == ResponseType.ERROR:
                     state.error = resp
                     state.is_finished = True
-                    await queue.put(resp)
+                    responses.put(resp)
                     break
                 elif resp.type == ResponseType.HEARTBEAT:
-                    # 心跳包也放入队列，用于重置超时计时器
-                    await queue.put(resp)
+                    # 心跳包也放入通道，用于重置超时计时器
+                    responses.put(resp)
                 elif resp.type == ResponseType.SESSION_FINISHED:
                     state.is_finished = True
-                    await queue.put(resp)
+                    responses.put(resp)
                     break
                 elif resp.type == ResponseType.FINAL_RESULT:
                     state.final_text = resp.text
-                    await queue.put(resp)
+                    responses.put(resp)
                 else:
-                    await queue.put(resp)
+                    responses.put(resp)
 
         except websockets.exceptions.ConnectionClosed:
             state.is_finished = True
         finally:
             # 结束信号
-            await queue.put(None)
+            responses.close()
+
+
+
+class _ResponseChannel:
+    """
+    接收任务到消费者的响应通道（单生产者、单消费者）
+
+    用 deque + Event 代替 asyncio.Queue：有积压响应时直接取出，不为每条响应
+    创建 Future，只有通道为空时才挂起等待。
+    """
+    def __init__(self) -> None:
+        self._items: deque[ASRResponse] = deque()
+        self._event = asyncio.Event()
+        self._closed = False
+
+    def put(self, resp: ASRResponse) -> None:
+        self._items.append(resp)
+        self._event.set()
+
+    def close(self) -> None:
+        """关闭通道，已放入的响应仍可取出"""
+        self._closed = True
+        self._event.set()
+
+    async def wait(self) -> bool:
+        """
+        等待直到有响应可取
+
+        :return: False 表示通道已关闭且没有剩余响应
+        """
+        while not self._items:
+            if self._closed:
+                return False
+            self._event.clear()
+            await self._event.wait()
+        return True
+
+    def popleft(self) -> ASRResponse:
+        return self._items.popleft()
+
+
+class _IdleTimer:
+    """
+    等待响应的超时定时器
+
+    只在等待响应期间计时，超时后关闭响应通道。
+    每个会话只挂一个 `loop.call_later` 定时器，收到响应时不重建，
+    定时器触发时若尚未超时则按剩余时间重新挂载。
+    """
+    def __init__(self, timeout: float, responses: _ResponseChannel) -> None:
+        self._timeout = timeout
+        self._responses = responses
+        self._loop = asyncio.get_running_loop()
+        self._waiting_since: Optional[float] = None
+        self._handle = self._loop.call_later(timeout, self._on_timer)
+
+    def start_waiting(self) -> None:
+        self._waiting_since = self._loop.time()
+
+    def stop_waiting(self) -> None:
+        self._waiting_since = None
+
+    def cancel(self) -> None:
+        self._handle.cancel()
+
+    def _on_timer(self) -> None:
+        if self._waiting_since is None:
+            delay = self._timeout
+        else:
+            delay = self._waiting_since + self._timeout - self._loop.time()
+            if delay <= 0:
+                self._responses.close()
+                return
+        self._handle = self._loop.call_later(delay, self._on_timer)
+
+
+def _set_tcp_cork(ws: ClientConnection, enabled: bool) -> bool:
+    """
+    设置底层连接的 TCP_CORK（仅 Linux 支持）
+
+    :return: 是否设置成功（平台不支持或无法取得 socket 时为 False）
+    """
+    option = getattr(socket, "TCP_CORK", None)
+    sock = ws.transport.get_extra_info("socket") if ws.transport else None
+    if option is None or sock is None:
+        return False
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, option, int(enabled))
+    except OSError:
+        return False
+    return True
 
 
-    
 def _build_start_task(request_id: str, token: str) -> bytes:
     """构建 StartTask 消息 pb 数据"""
     request = AsrRequest()
@@ -484,14 +664,14 @@ def _build_start_task(request_id: str, token: str) -> bytes:
     return request.SerializeToString()
 
 
-def _build_start_session(request_id: str, token: str, config: SessionConfig) -> bytes:
-    """构建 StartSession 消息 pb 数据"""
+def _build_start_session(request_id: str, token: str, config_json: str) -> bytes:
+    """构建 StartSession 消息 pb 数据，`config_json` 为序列化后的 `SessionConfig`"""
     request = AsrRequest()
     request.token = token
     request.service_name = "ASR"
     request.method_name = "StartSession"
     request.request_id = request_id
-    request.payload = config.model_dump_json()
+    request.payload = config_json
     return request.SerializeToString()
 
 
@@ -505,23 +685,65 @@ def _build_finish_session(request_id: str, token: str) -> bytes:
     return request.SerializeToString()
 
 
+@dataclass(frozen=True)
+class _TaskRequestTemplate:
+    """
+    会话内复用的 TaskRequest 消息模板
+
+    protobuf 按字段编号顺序序列化，TaskRequest 中只有 payload(6)、audio_data(7)、
+    frame_state(9) 逐帧变化，前后不变的字段预先序列化为 prefix/suffix：
+    prefix = service_name(3) + method_name(5)，suffix = request_id(8)
+    """
+    prefix: bytes
+    suffix: bytes
+
+
+def _new_task_request_template(request_id: str) -> _TaskRequestTemplate:
+    """构建会话内复用的 TaskRequest 消息模板（预置不变的字段）"""
+    prefix = AsrRequest(service_name="ASR", method_name="TaskRequest")
+    suffix = AsrRequest(request_id=request_id)
+    return _TaskRequestTemplate(prefix.SerializeToString(), suffix.SerializeToString())
+
+
+def _encode_varint(value: int) -> bytes:
+    """protobuf varint 编码（非负整数）"""
+    if value < 0x80:
+        return bytes((value,))
+    out = bytearray()
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+# 逐帧变化字段的 tag：(field_number << 3) | wire_type
+_PAYLOAD_TAG = b"\x32"      # payload = 6, length-delimited
+_AUDIO_DATA_TAG = b"\x3a"   # audio_data = 7, length-delimited
+_FRAME_STATE_TAG = b"\x48"  # frame_state = 9, varint
+
+
 def _build_asr_request(
+    template: _TaskRequestTemplate,
     audio_data: bytes,
-    request_id: str,
     frame_state: FrameState,
     timestamp_ms: int,
 ) -> bytes:
-    request = AsrRequest()
-    metadata = json.dumps({"extra": {}, "timestamp_ms": timestamp_ms})
-
-    request.service_name = "ASR"
-    request.method_name = "TaskRequest"
-    request.payload = metadata
-    request.audio_data = audio_data
-    request.request_id = request_id
-    request.frame_state = frame_state
-    return request.SerializeToString()
+    """
+    按 `_new_task_request_template` 生成的模板直接拼接 TaskRequest 的 pb 数据
 
+    每帧都会调用，绕过 protobuf 的对象构建和序列化，结果与 `SerializeToString()` 一致
+    """
+    # 直接拼接元数据 JSON，避免 json.dumps 的开销（纯 ASCII，长度即字节数）
+    payload = f'{{"extra":{{}},"timestamp_ms":{timestamp_ms}}}'.encode()
+    parts = [template.prefix, _PAYLOAD_TAG, _encode_varint(len(payload)), payload]
+    # proto3 不序列化默认值（空 bytes、枚举 0）
+    if audio_data:
+        parts += (_AUDIO_DATA_TAG, _encode_varint(len(audio_data)), audio_data)
+    parts.append(template.suffix)
+    if frame_state:
+        parts += (_FRAME_STATE_TAG, _encode_varint(frame_state))
+    return b"".join(parts)
 
 
 def _parse_word(data: dict) -> ASRWord:
@@ -586,6 +808,28 @@ def _parse_extra(data: dict) -> ASRExtra:
     )
 
 
+# 心跳包很短且只有 extra 等元数据；超过此长度或包含以下任一标记的结果仍完整解析
+_HEARTBEAT_MAX_LEN = 256
+_NON_HEARTBEAT_MARKERS = ('"results"', '"err', '"code"')
+
+
+def _is_obvious_heartbeat(result_json: str) -> bool:
+    """
+    不解析 JSON，判断 result_json 是否明显是心跳包
+
+    只接受短小、形如 JSON 对象且不含 results / 错误码标记的内容，
+    格式异常或可能携带错误信息的结果交给完整解析处理
+    """
+    if len(result_json) > _HEARTBEAT_MAX_LEN:
+        return False
+    if not (result_json.startswith("{") and result_json.endswith("}")):
+        return False
+    # 括号不配对说明内容被截断或格式异常
+    if result_json.count("{") != result_json.count("}"):
+        return False
+    return not any(marker in result_json for marker in _NON_HEARTBEAT_MARKERS)
+
+
 def _parse_response(data: bytes) -> ASRResponse:
     """解析 ASR 响应 (使用 protobuf)"""
     pb = AsrResponsePb()
@@ -612,26 +856,26 @@ def _parse_response(data: bytes) -> ASRResponse:
     if not result_json:
         return ASRResponse(type=ResponseType.UNKNOWN)
 
+    # 心跳包仅用于重置超时、不会转发给用户，明显是心跳包时无需解析 JSON
+    if _is_obvious_heartbeat(result_json):
+        return ASRResponse(type=ResponseType.HEARTBEAT)
+
     try:
-        json_data = json.loads(result_json)
-    except json.JSONDecodeError:
+        json_data = _json.loads(result_json)
+    except _json.JSONDecodeError:
         return ASRResponse(type=ResponseType.UNKNOWN)
 
     results_raw = json_data.get("results")
+
+    # results 为空值，同样视为心跳包，与上面的快速路径返回相同形态
+    if results_raw is None:
+        return ASRResponse(type=ResponseType.HEARTBEAT)
+
     extra_raw = json_data.get("extra", {})
 
     # 解析为强类型
     parsed_extra = _parse_extra(extra_raw)
 
-    # 无 results，可能是心跳包
-    if results_raw is None:
-        return ASRResponse(
-            type=ResponseType.HEARTBEAT,
-            packet_number=extra_raw.get("packet_number", -1),
-            raw_json=json_data,
-            extra=parsed_extra,
-        )
-
     # 解析 results
     parsed_results = [_parse_result(r) for r in results_raw]
 
@@ -689,6 +933,24 @@ def _parse_response(data: bytes) -> ASRResponse:
 # =============
 
 
+def uvloop_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """
+    便捷函数：返回 uvloop 的事件循环工厂（如已安装）
+
+    uvloop 的 WebSocket 收发比默认事件循环快得多。返回值直接传给
+    `asyncio.run(main(), loop_factory=...)`（Python 3.12+）或
+    `asyncio.Runner(loop_factory=...)`（Python 3.11），不修改全局事件循环策略。
+
+    Returns:
+        `uvloop.new_event_loop`；未安装 uvloop 时返回 None，即使用默认事件循环
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
 async def transcribe(
     audio: str | Path | bytes,
     *,
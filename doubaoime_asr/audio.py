@@ -15,6 +15,8 @@ class AudioEncoder:
     def __init__(self, config: ASRConfig) -> None:
         self.config = config
         self._encoder: Optional[opuslib.Encoder] = None
+        # (帧采样数, 帧字节数, 静音帧编码结果)
+        self._silent_frame: Optional[tuple[int, int, bytes]] = None
     
     @property
     def encoder(self) -> opuslib.Encoder:
@@ -25,22 +27,56 @@ class AudioEncoder:
                 opuslib.APPLICATION_AUDIO,
             )
         return self._encoder
+
+    @property
+    def silent_opus_frame(self) -> bytes:
+        """
+        一帧静音的 Opus 编码结果，只取决于帧大小，编码一次后复用；帧大小变化时重新编码
+        """
+        samples_per_frame = self.config.samples_per_frame
+        bytes_per_frame = self.config.bytes_per_frame
+        cached = self._silent_frame
+        if cached is None or cached[0] != samples_per_frame or cached[1] != bytes_per_frame:
+            frame = self.encoder.encode(b"\x00" * bytes_per_frame, samples_per_frame)
+            cached = self._silent_frame = (samples_per_frame, bytes_per_frame, frame)
+        return cached[2]
     
-    def pcm_to_opus_frames(self, pcm_data: bytes) -> List[bytes]:
-        samples_per_frame = (
-            self.config.sample_rate * self.config.frame_duration_ms // 1000
-        )
-        bytes_per_frame = samples_per_frame * 2 # 16-bit
-
-        frames = []
-        for i in range(0, len(pcm_data), bytes_per_frame):
-            chunk = pcm_data[i : i + bytes_per_frame]
-            if len(chunk) < bytes_per_frame:
-                chunk = chunk + b"\x00" * (bytes_per_frame - len(chunk))
-            
-            opus_frame = self.encoder.encode(chunk, samples_per_frame)
-            frames.append(opus_frame)
-        
+    def pcm_to_opus_frames(self, pcm_data: Union[bytes, bytearray, memoryview]) -> List[bytes]:
+        samples_per_frame = self.config.samples_per_frame
+        bytes_per_frame = self.config.bytes_per_frame
+        if isinstance(pcm_data, bytes):
+            return self._encode_frames(pcm_data, samples_per_frame, bytes_per_frame)
+        # 其他缓冲区按字节视图切片，切片本身不拷贝
+        with memoryview(pcm_data) as view, view.cast("B") as byte_view:
+            return self._encode_frames(byte_view, samples_per_frame, bytes_per_frame)
+
+    def _encode_frames(
+        self,
+        pcm: Union[bytes, memoryview],
+        samples_per_frame: int,
+        bytes_per_frame: int,
+    ) -> List[bytes]:
+        encode = self.encoder.encode
+        full_count, tail = divmod(len(pcm), bytes_per_frame)
+        # 帧数已知，预分配列表
+        frames: List[bytes] = [b""] * (full_count + (tail > 0))
+
+        # opuslib 只接受 bytes，每帧必然拷贝一次：bytes 输入直接切片即可，
+        # 不再额外经过 memoryview
+        if isinstance(pcm, bytes):
+            for index in range(full_count):
+                i = index * bytes_per_frame
+                frames[index] = encode(pcm[i : i + bytes_per_frame], samples_per_frame)
+        else:
+            for index in range(full_count):
+                i = index * bytes_per_frame
+                frames[index] = encode(bytes(pcm[i : i + bytes_per_frame]), samples_per_frame)
+
+        if tail:
+            # 仅最后一帧不足时补零
+            chunk = bytes(pcm[-tail:]).ljust(bytes_per_frame, b"\x00")
+            frames[full_count] = encode(chunk, samples_per_frame)
+
         return frames
     
     @staticmethod
@@ -1,33 +1,40 @@
-import base64
+import binascii
+import contextlib
 from dataclasses import dataclass, field
-import json
+from functools import lru_cache
+import os
 from pathlib import Path
 import time
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Iterator, Optional, Union
 from pydantic import BaseModel
 
+from . import _json
 from .constants import WEBSOCKET_URL, USER_AGENT, AID
 from .device import DeviceCredentials, register_device, get_asr_token
 from .sami import get_sami_token
 
+if TYPE_CHECKING:
+    from .wave_client import WaveClient
 
-def _jwt_is_expired(token: str, margin: int = 60) -> bool:
+
+_B64URL_TO_STD = str.maketrans("-_", "+/")
+
+
+@lru_cache(maxsize=32)
+def _jwt_exp(token: str) -> Optional[float]:
     """
-    检查 JWT token 是否已过期（提前 margin 秒视为过期）
+    解析 JWT token 的过期时间 exp，无法解析或没有 exp 时返回 None
+
+    同一个 token 在有效期内会被反复检查，解析结果按 token 缓存
     """
     try:
         payload_b64 = token.split(".")[1]
-        # JWT base64url 需要补齐 padding
-        padding = 4 - len(payload_b64) % 4
-        if padding != 4:
-            payload_b64 += "=" * padding
-        payload = json.loads(base64.urlsafe_b64decode(payload_b64))
-        exp = payload.get("exp")
-        if exp is None:
-            return False
-        return time.time() >= exp - margin
-    except (IndexError, ValueError, json.JSONDecodeError):
-        return False
+        # JWT 使用不带 padding 的 base64url：转换为标准字母表后直接补两个 "="，
+        # 非严格模式下多余的 padding 会被忽略，省去计算补齐长度
+        payload = _json.loads(binascii.a2b_base64(payload_b64.translate(_B64URL_TO_STD) + "=="))
+        return payload.get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
 
 
 class _AudioInfo(BaseModel):
@@ -55,7 +62,7 @@ class SessionConfig(BaseModel):
     extra: _SessionExtraConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ASRConfig:
     """
     ASR 配置
@@ -106,45 +113,102 @@ class ASRConfig:
     app_name: str = "com.android.chrome"
 
     # 连接配置
+    # 不提供 TCP_NODELAY 选项：asyncio（以及 uvloop）建立 TCP 连接时已默认开启，
+    # 实时模式的小帧不会被 Nagle 算法攒批延迟
     connect_timeout: float = 10.0
-    recv_timeout: float = 10.0
+    # 等待服务器响应的超时时间，None 表示不设超时（依靠 WebSocket 层检测断开）
+    recv_timeout: Optional[float] = 10.0
 
     # 内部状态
-    _credentials: Optional[DeviceCredentials] = field(default=None, repr=None)
+    _credentials: Optional[DeviceCredentials] = field(default=None, repr=False)
     _initialized: bool = field(default=False, repr=False)
-    _wave_client: Optional[object] = field(default=None, repr=False)
+    _wave_client: Optional["WaveClient"] = field(default=None, repr=False)
+    _session_config: Optional[SessionConfig] = field(default=None, repr=False)
+    _session_config_json: Optional[str] = field(default=None, repr=False)
+    # 构建 _session_config 时所依据的字段值，任一字段变化即重新构建
+    _session_config_key: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    _save_deferred: int = field(default=0, init=False, repr=False)
+    _save_pending: bool = field(default=False, init=False, repr=False)
+    # (credential_path 原值, 展开后的路径)，以及该路径所在目录是否已创建
+    _credential_file: Optional[tuple[Union[str, Path], Path]] = field(default=None, init=False, repr=False)
+    _credential_dir_ready: bool = field(default=False, init=False, repr=False)
+    # 上次检查的 sami_token 及其过期时间 exp
+    _sami_token_exp: Optional[tuple[str, Optional[float]]] = field(default=None, init=False, repr=False, compare=False)
+
+    def _credential_file_path(self) -> Optional[Path]:
+        """
+        展开后的凭据文件路径，credential_path 被重新赋值时重新展开
+        """
+        raw = self.credential_path
+        if raw is None:
+            return None
+        cached = self._credential_file
+        if cached is None or cached[0] != raw:
+            cached = self._credential_file = (raw, Path(raw).expanduser())
+            self._credential_dir_ready = False
+        return cached[1]
 
     def _load_credentials_from_file(self) -> Optional[DeviceCredentials]:
         """
         从缓存文件中加载凭据信息
         """
-        if self.credential_path is None:
+        path = self._credential_file_path()
+        if path is None:
             return None
 
-        path = Path(self.credential_path).expanduser()
-        if not path.exists():
-            return None
-        
+        # 文件不存在时 open 抛出 FileNotFoundError，无需额外 stat 一次
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = json.loads(f.read())
-                return DeviceCredentials(**data)
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
 
-        except (json.JSONDecodeError, OSError):
+        # 由 pydantic 直接解析 JSON 字节并校验，不经过中间 dict
+        try:
+            return DeviceCredentials.model_validate_json(data)
+        except ValueError:
             return None
     
     def _save_credentials_to_file(self, creds: DeviceCredentials):
         """
         保存凭据至缓存文件
         """
-        if self.credential_path is None:
+        path = self._credential_file_path()
+        if path is None:
             return
-        
-        path = Path(self.credential_path).expanduser()
-        path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(creds.model_dump(), f, indent=2, ensure_ascii=False)
+        if not self._credential_dir_ready:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._credential_dir_ready = True
+
+        # 先写临时文件再替换，避免写入中断导致凭据文件损坏
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(_json.dumps(creds.model_dump(), indent=True))
+        os.replace(tmp_path, path)
+
+    def _update_credentials_file(self) -> None:
+        """
+        凭据缓存有更新时写回文件，处于 `_deferred_save()` 中时推迟到退出时统一写入
+        """
+        if self._save_deferred:
+            self._save_pending = True
+            return
+        self._save_credentials_to_file(self._credentials)
+
+    @contextlib.contextmanager
+    def _deferred_save(self) -> Iterator[None]:
+        """
+        在此范围内对凭据缓存的多次更新（如 wave 会话和 sami_token 同时刷新）只写一次文件
+        """
+        self._save_deferred += 1
+        try:
+            yield
+        finally:
+            self._save_deferred -= 1
+            if not self._save_deferred and self._save_pending:
+                self._save_pending = False
+                self._save_credentials_to_file(self._credentials)
     
     def ensure_credentials(self):
         """
@@ -198,8 +262,23 @@ class ASRConfig:
         if user_token is not None:
             self.token = user_token
 
+        # 直接传入 device_id/token 且无缓存文件时不会注册设备，这里补一份凭据，
+        # 以便 sami_token / wave 会话能够缓存（指定了 credential_path 时一并写入文件）
+        if self._credentials is None:
+            self._credentials = DeviceCredentials(device_id=self.device_id, token=self.token)
+
         self._initialized = True
     
+    @property
+    def samples_per_frame(self) -> int:
+        """每帧每声道的采样数（随音频配置实时计算，修改配置后立即生效）"""
+        return self.sample_rate * self.frame_duration_ms // 1000
+
+    @property
+    def bytes_per_frame(self) -> int:
+        """每帧 PCM 字节数（16-bit，包含所有声道）"""
+        return self.samples_per_frame * self.channels * 2
+
     @property
     def ws_url(self) -> str:
         self.ensure_credentials()
@@ -214,6 +293,38 @@ class ASRConfig:
         }
 
     def session_config(self) -> SessionConfig:
+        """
+        会话配置，首次调用后缓存；参与构建的任一字段被修改时重新构建
+        """
+        self.ensure_credentials()
+        key = (
+            self.device_id,
+            self.sample_rate,
+            self.channels,
+            self.enable_punctuation,
+            self.enable_speech_rejection,
+            self.enable_asr_twopass,
+            self.enable_asr_threepass,
+            self.app_name,
+        )
+        config = self._session_config
+        if config is None or key != self._session_config_key:
+            config = self._session_config = self._build_session_config()
+            self._session_config_json = None
+            self._session_config_key = key
+        return config
+
+    @property
+    def session_config_json(self) -> str:
+        """
+        序列化后的会话配置，作为 StartSession 的 payload（随 `session_config()` 缓存）
+        """
+        config = self.session_config()
+        if self._session_config_json is None:
+            self._session_config_json = config.model_dump_json()
+        return self._session_config_json
+
+    def _build_session_config(self) -> SessionConfig:
         self.ensure_credentials()
         audio_info = _AudioInfo(
             channel=self.channels,
@@ -237,7 +348,8 @@ class ASRConfig:
         )
     
     def get_token(self) -> str:
-        self.ensure_credentials()
+        if not self._initialized:
+            self.ensure_credentials()
         return self.token
 
     def _on_wave_session_update(self, session) -> None:
@@ -246,7 +358,7 @@ class ASRConfig:
         """
         if self._credentials:
             self._credentials.wave_session = session.to_dict()
-            self._save_credentials_to_file(self._credentials)
+            self._update_credentials_file()
 
     def get_wave_client(self):
         """
@@ -266,7 +378,7 @@ class ASRConfig:
                     session = WaveSession.from_dict(self._credentials.wave_session)
                     if not session.is_expired():
                         cached_session = session
-                except (KeyError, ValueError):
+                except (KeyError, TypeError, ValueError):
                     pass
 
             self._wave_client = WaveClient(
@@ -277,6 +389,20 @@ class ASRConfig:
             )
         return self._wave_client
 
+    def _sami_token_expired(self, token: str, margin: int = 60) -> bool:
+        """
+        检查 sami_token 是否已过期（提前 margin 秒视为过期）
+
+        token 未变化（同一对象）时直接复用上次解析出的 exp，只做一次时间比较
+        """
+        cached = self._sami_token_exp
+        if cached is None or cached[0] is not token:
+            cached = self._sami_token_exp = (token, _jwt_exp(token))
+        exp = cached[1]
+        if exp is None:
+            return False
+        return time.time() >= exp - margin
+
     def get_sami_token(self) -> str:
         """
         获取 SAMI token（用于 NER 等服务）
@@ -288,7 +414,7 @@ class ASRConfig:
         # 优先使用已缓存且未过期的 sami_token
         if (self._credentials
                 and self._credentials.sami_token
-                and not _jwt_is_expired(self._credentials.sami_token)):
+                and not self._sami_token_expired(self._credentials.sami_token)):
             return self._credentials.sami_token
 
         # 请求新的 sami_token
@@ -298,6 +424,6 @@ class ASRConfig:
         # 缓存到凭据中
         if self._credentials:
             self._credentials.sami_token = sami_token
-            self._save_credentials_to_file(self._credentials)
+            self._update_credentials_file()
 
         return sami_token
\ No newline at end of file
@@ -55,4 +55,22 @@ DEFAULT_DEVICE_CONFIG = {
     "rom_version": "UP1A.231005.007",
 }
 
+# 设备注册 / Settings / SAMI 等接口 URL Params 中的应用配置（值均为字符串）
+APP_PARAMS = {
+    "channel": APP_CONFIG["channel"],
+    "aid": str(APP_CONFIG["aid"]),
+    "app_name": APP_CONFIG["app_name"],
+    "version_code": str(APP_CONFIG["version_code"]),
+    "version_name": APP_CONFIG["version_name"],
+    "manifest_version_code": str(APP_CONFIG["manifest_version_code"]),
+    "update_version_code": str(APP_CONFIG["update_version_code"]),
+}
+
+# 上述接口 URL Params 中的设备信息
+DEVICE_PARAMS = {
+    k: DEFAULT_DEVICE_CONFIG[k]
+    for k in ("device_platform", "os", "resolution", "dpi", "device_type",
+              "device_brand", "language", "os_api", "os_version")
+}
+
 USER_AGENT = "com.bytedance.android.doubaoime/100102018 (Linux; U; Android 16; en_US; Pixel 7 Pro; Build/BP2A.250605.031.A2; Cronet/TTNetVersion:94cf429a 2025-11-17 QuicVersion:1f89f732 2025-05-08)"
\ No newline at end of file
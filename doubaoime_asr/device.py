@@ -8,11 +8,10 @@ from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 import secrets
-import requests
 import time
-import uuid
 
-from .constants import APP_CONFIG, DEFAULT_DEVICE_CONFIG, USER_AGENT, REGISTER_URL, SETTINGS_URL
+from . import _http
+from .constants import APP_CONFIG, APP_PARAMS, DEFAULT_DEVICE_CONFIG, DEVICE_PARAMS, USER_AGENT, REGISTER_URL, SETTINGS_URL
 
 
 class DeviceCredentials(BaseModel):
@@ -162,19 +161,7 @@ class DeviceRegisterParams(BaseModel):
         使用默认配置构建 URL Params
         """
 
-        app_config = {
-            **{k: APP_CONFIG[k] for k in ("channel", "app_name", "version_name")},
-            "aid": str(APP_CONFIG["aid"]),
-            "version_code": str(APP_CONFIG["version_code"]),
-            "manifest_version_code": str(APP_CONFIG["manifest_version_code"]),
-            "update_version_code": str(APP_CONFIG["update_version_code"]),
-        }
-        
-        device_keys = ("device_platform", "os", "resolution", "dpi", "device_type",
-                       "device_brand", "language", "os_api", "os_version")
-        device_config = {k: DEFAULT_DEVICE_CONFIG[k] for k in device_keys}
-
-        return cls(cdid=cdid, **app_config, **device_config)
+        return cls(cdid=cdid, **APP_PARAMS, **DEVICE_PARAMS)
 
 
 class DeviceRegisterResponse(BaseModel):
@@ -214,11 +201,11 @@ class SettingsParams(BaseModel):
         return cls(
             cdid=cdid,
             device_id=device_id,
-            channel=APP_CONFIG["channel"],
-            aid=str(APP_CONFIG["aid"]),
-            app_name=APP_CONFIG["app_name"],
-            version_code=str(APP_CONFIG["version_code"]),
-            version_name=APP_CONFIG["version_name"],
+            channel=APP_PARAMS["channel"],
+            aid=APP_PARAMS["aid"],
+            app_name=APP_PARAMS["app_name"],
+            version_code=APP_PARAMS["version_code"],
+            version_name=APP_PARAMS["version_name"],
         )
 
 
@@ -248,16 +235,34 @@ class SettingsResponse(BaseModel):
         return self.data.settings.asr_config.app_key
         
 
+# Settings API 的请求体固定不变，x-ss-stub（请求体 MD5）也预先算好
+_SETTINGS_BODY = "body=null"
+_SETTINGS_X_SS_STUB = hashlib.md5(_SETTINGS_BODY.encode(), usedforsecurity=False).hexdigest().upper()
+
+
+def _uuid4_str() -> str:
+    """
+    生成随机 UUID（version 4）字符串，与 `str(uuid.uuid4())` 格式相同
+
+    直接从随机字节格式化，省去 `uuid.UUID` 对象的构建和格式化开销
+    """
+    b = bytearray(secrets.token_bytes(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
 def _generate_openudid() -> str:
     return secrets.token_hex(8)
 
 
 def _generate_cdid() -> str:
-    return str(uuid.uuid4())
+    return _uuid4_str()
 
 
 def _generate_clientudid() -> str:
-    return str(uuid.uuid4())
+    return _uuid4_str()
 
 
 def register_device() -> DeviceCredentials:
@@ -276,7 +281,7 @@ def register_device() -> DeviceCredentials:
         "User-Agent": USER_AGENT,
     }
 
-    response = requests.post(
+    response = _http.session.post(
         REGISTER_URL,
         params=params.model_dump(),
         json=body.model_dump(),
@@ -284,8 +289,8 @@ def register_device() -> DeviceCredentials:
     )
 
     response.raise_for_status()
-    response_json = response.json()
-    response_data = DeviceRegisterResponse(**response_json)
+    # 直接从响应字节解析并校验，不经过中间 dict
+    response_data = DeviceRegisterResponse.model_validate_json(response.content)
 
     if response_data.device_id and response_data.device_id != 0:
         return DeviceCredentials(
@@ -305,23 +310,21 @@ def get_asr_token(device_id: str, cdid: str) -> str:
         cdid = _generate_cdid()
 
     params = SettingsParams.default(device_id, cdid)
-    body_str = "body=null"
-    x_ss_stub = hashlib.md5(body_str.encode()).hexdigest().upper()
 
     headers = {
         "User-Agent": USER_AGENT,
-        "x-ss-stub": x_ss_stub,
+        "x-ss-stub": _SETTINGS_X_SS_STUB,
     }
 
-    response = requests.post(
+    response = _http.session.post(
         SETTINGS_URL,
         params=params,
-        data=body_str,
+        data=_SETTINGS_BODY,
         headers=headers,
     )
     
     response.raise_for_status()
-    response_json = response.json()
-    response_data = SettingsResponse(**response_json)
+    # 直接从响应字节解析并校验，不经过中间 dict
+    response_data = SettingsResponse.model_validate_json(response.content)
 
     return response_data.app_key
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 import base64
-import json
-import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, List
 
-import requests
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 
+from . import _http, _json
+from .device import _uuid4_str
 from .wave_client import WaveClient
-from .constants import AID, APP_CONFIG, NER_URL, SAMI_APP_KEY
+from .constants import APP_PARAMS, NER_URL, SAMI_APP_KEY
 
 if TYPE_CHECKING:
     from .config import ASRConfig
 
 
-class NerUserInfo(BaseModel):
+# 请求体由内部构建，无需 pydantic 校验，使用轻量的 slots dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
+class NerUserInfo:
     uid: str = "0"
     did: str
     app_name: str
@@ -25,23 +29,40 @@ class NerUserInfo(BaseModel):
     experience_improve: bool = False
 
     @classmethod
+    @lru_cache(maxsize=16)
     def new(cls, did: str, app_name: str):
-        app_version = APP_CONFIG.get("version_name", "")
+        # 同一设备/应用的用户信息不变，且实例不可变，可以直接复用
+        app_version = APP_PARAMS["version_name"]
         return cls(did=did, app_name=app_name, app_version=app_version)
 
 
-class NerRequest(BaseModel):
+@dataclass(slots=True, frozen=True)
+class NerRequest:
     """
     ner 接口请求体
     """
     user: NerUserInfo
     text: str
-    additions: dict = Field(default_factory=dict)
+    additions: dict = field(default_factory=dict)
 
     @classmethod
     def new(cls, text: str, did: str, app_name: str = "", addiction: dict = None):
         return cls(user=NerUserInfo.new(did, app_name), text=text, additions=addiction or {})
 
+    def to_json(self) -> bytes:
+        """序列化为 JSON 请求体"""
+        return _json.dumps({
+            "user": _user_info_dict(self.user),
+            "text": self.text,
+            "additions": self.additions,
+        })
+
+
+@lru_cache(maxsize=16)
+def _user_info_dict(user: NerUserInfo) -> dict:
+    """NerUserInfo 转为 dict 的结果按实例缓存，避免每次请求都 asdict 一遍"""
+    return asdict(user)
+
 
 class NerWord(BaseModel):
     freq: int
@@ -60,6 +81,16 @@ class NerResponse(BaseModel):
     results: List[NerResult]
 
 
+# ner 接口中固定不变的请求头
+_NER_BASE_HEADERS = {
+    'app_version': APP_PARAMS['version_name'],
+    'app_id': APP_PARAMS['aid'],
+    'os_type': 'android',
+    'x-api-resource-id': 'asr.user.context',
+    'x-api-app-key': SAMI_APP_KEY,
+}
+
+
 def get_ner_results(wave_client: WaveClient, sami_token: str, text: str, did: str, app_name: str = "") -> NerResponse:
     """
     调用 ner 接口获取结果
@@ -67,26 +98,22 @@ def get_ner_results(wave_client: WaveClient, sami_token: str, text: str, did: st
     request = NerRequest.new(text, did, app_name)
 
     headers = {
-        'app_version': APP_CONFIG.get('version_name', ''),
-        'app_id': str(AID),
-        'os_type': 'android',
-        'x-api-resource-id': 'asr.user.context',
-        'x-api-app-key': SAMI_APP_KEY,
+        **_NER_BASE_HEADERS,
         'x-api-token': sami_token,
-        'x-api-request-id': str(uuid.uuid4()),
+        'x-api-request-id': _uuid4_str(),
     }
-    req_data = request.model_dump_json().encode()
+    req_data = request.to_json()
 
     payload, headers = wave_client.prepare_request(req_data, headers)
 
-    response = requests.post(NER_URL, data=payload, headers=headers)
+    response = _http.session.post(NER_URL, data=payload, headers=headers)
 
     resp_headers = response.headers
     nonce = base64.b64decode(resp_headers.get('x-tt-e-p'))
 
     decoded = wave_client.decrypt(response.content, nonce=nonce)
 
-    return NerResponse(**json.loads(decoded.decode()))
+    return NerResponse.model_validate_json(decoded)
 
 
 def ner(config: ASRConfig, text: str, app_name: str = "") -> NerResponse:
@@ -101,6 +128,16 @@ def ner(config: ASRConfig, text: str, app_name: str = "") -> NerResponse:
     :return: NER 响应
     """
     config.ensure_credentials()
-    wave_client = config.get_wave_client()
-    sami_token = config.get_sami_token()
-    return get_ner_results(wave_client, sami_token, text, config.device_id, app_name)
+    # wave 会话和 sami_token 可能同时刷新，合并为一次凭据文件写入
+    with config._deferred_save():
+        wave_client = config.get_wave_client()
+        if wave_client._session_expired():
+            # 握手和获取 sami_token 互不依赖，并行请求以节省一次往返；
+            # 握手使用 WaveClient 自己的 HTTP 会话，不与本线程共用连接
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                handshake = executor.submit(wave_client._ensure_session)
+                sami_token = config.get_sami_token()
+                handshake.result()
+        else:
+            sami_token = config.get_sami_token()
+        return get_ner_results(wave_client, sami_token, text, config.device_id, app_name)
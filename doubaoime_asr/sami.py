@@ -4,13 +4,14 @@ SAMI 服务相关
 
 import hashlib
 import time
-import uuid
 from typing import Optional
 
 import requests
 from pydantic import BaseModel, ConfigDict, Field
 
-from .constants import SAMI_CONFIG_URL, SAMI_APP_KEY, USER_AGENT, APP_CONFIG, DEFAULT_DEVICE_CONFIG
+from . import _http
+from .device import _generate_cdid
+from .constants import SAMI_CONFIG_URL, SAMI_APP_KEY, USER_AGENT, APP_PARAMS, DEVICE_PARAMS
 
 
 class _SamiConfigParams(BaseModel):
@@ -46,19 +47,7 @@ class _SamiConfigParams(BaseModel):
         """
         使用默认配置构建 SAMI 配置 Params
         """
-        app_config = {
-            **{k: APP_CONFIG[k] for k in ("channel", "app_name", "version_name")},
-            "aid": str(APP_CONFIG["aid"]),
-            "version_code": str(APP_CONFIG["version_code"]),
-            "manifest_version_code": str(APP_CONFIG["manifest_version_code"]),
-            "update_version_code": str(APP_CONFIG["update_version_code"]),
-        }
-
-        device_keys = ("device_platform", "os", "resolution", "dpi", "device_type",
-                       "device_brand", "language", "os_api", "os_version")
-        device_config = {k: DEFAULT_DEVICE_CONFIG[k] for k in device_keys}
-
-        return cls(cdid=cdid, **app_config, **device_config)
+        return cls(cdid=cdid, **APP_PARAMS, **DEVICE_PARAMS)
 
 
 class _SamiConfigRequest(BaseModel):
@@ -86,6 +75,11 @@ class _SamiConfigResponse(BaseModel):
         return self.data.sami_token
 
 
+# 请求体只包含常量 SAMI_APP_KEY，序列化结果和 x-ss-stub（请求体 MD5）预先算好
+_SAMI_CONFIG_BODY = _SamiConfigRequest().model_dump_json()
+_SAMI_CONFIG_X_SS_STUB = hashlib.md5(_SAMI_CONFIG_BODY.encode(), usedforsecurity=False).hexdigest().upper()
+
+
 def get_sami_config(cdid: str) -> requests.Response:
     """
     获取 SAMI 配置 (包含 token)
@@ -97,23 +91,20 @@ def get_sami_config(cdid: str) -> requests.Response:
         响应对象
     """
     params = _SamiConfigParams.default(cdid)
-    body = _SamiConfigRequest()
-    body_json = body.model_dump_json()
-    x_ss_stub = hashlib.md5(body_json.encode()).hexdigest().upper()
 
     headers = {
         "User-Agent": USER_AGENT,
         "Content-Type": "application/json",
-        "app_version": APP_CONFIG["version_name"],
-        "app_id": str(APP_CONFIG["aid"]),
+        "app_version": APP_PARAMS["version_name"],
+        "app_id": APP_PARAMS["aid"],
         "os_type": "Android",
-        "x-ss-stub": x_ss_stub,
+        "x-ss-stub": _SAMI_CONFIG_X_SS_STUB,
     }
 
-    response = requests.post(
+    response = _http.session.post(
         SAMI_CONFIG_URL,
         params=params.model_dump(by_alias=True),
-        data=body_json,
+        data=_SAMI_CONFIG_BODY,
         headers=headers,
     )
 
@@ -128,10 +119,11 @@ def get_sami_token(cdid: Optional[str] = None) -> str:
     :return: SAMI token 字符串
     """
     if cdid is None:
-        cdid = str(uuid.uuid4())
+        cdid = _generate_cdid()
 
     response = get_sami_config(cdid)
     response.raise_for_status()
 
-    data = _SamiConfigResponse(**response.json())
+    # 直接从响应字节解析并校验，不经过中间 dict
+    data = _SamiConfigResponse.model_validate_json(response.content)
     return data.sami_token
@@ -3,22 +3,33 @@ ByteDance Wave 加密协议客户端
 """
 
 import base64
+import binascii
+from dataclasses import dataclass
 import hashlib
+import hmac
 import secrets
 import time
 from typing import Callable, Optional, Union
 
-import requests
-from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import ec
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms
-from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from pydantic import BaseModel
 
+from . import _http, _json
 from .constants import HANDSHAKE_URL, HKDF_INFO, USER_AGENT
 
 
+# 握手使用的曲线与算法对象无状态，模块级复用；
+# 密钥对本身每次握手重新生成（临时密钥，保证前向安全），不做缓存
+_CURVE = ec.SECP256R1()
+_ECDSA_SHA256 = ec.ECDSA(hashes.SHA256())
+_ECDH = ec.ECDH()
+
+# ChaCha20 初始块计数器（4 字节小端 0）
+_INITIAL_COUNTER = bytes(4)
+
+
 class _KeyShare(BaseModel):
     """
     密钥交换信息
@@ -27,7 +38,9 @@ class _KeyShare(BaseModel):
     pubkey: str
 
 
-class _HandshakeRequest(BaseModel):
+# 请求体由内部构建，无需 pydantic 校验，使用轻量的 slots dataclass
+@dataclass(slots=True, frozen=True, kw_only=True)
+class _HandshakeRequest:
     """
     握手请求
     """
@@ -35,8 +48,22 @@ class _HandshakeRequest(BaseModel):
     random: str
     app_id: str
     did: str
-    key_shares: list[_KeyShare]
-    cipher_suites: list[int] = [4097]  # ChaCha20
+    pubkey: str
+    """
+    secp256r1 公钥（base64），作为唯一的 key_share 发送
+    """
+    cipher_suites: tuple[int, ...] = (4097,)  # ChaCha20
+
+    def to_json(self) -> bytes:
+        """序列化为 JSON 请求体（签名与发送使用同一份字节）"""
+        return _json.dumps({
+            "version": self.version,
+            "random": self.random,
+            "app_id": self.app_id,
+            "did": self.did,
+            "key_shares": [{"curve": "secp256r1", "pubkey": self.pubkey}],
+            "cipher_suites": list(self.cipher_suites),
+        })
 
 
 class _HandshakeResponse(BaseModel):
@@ -80,10 +107,10 @@ class WaveSession(BaseModel):
         return {
             "ticket": self.ticket,
             "ticket_long": self.ticket_long,
-            "encryption_key": base64.b64encode(self.encryption_key).decode(),
-            "client_random": base64.b64encode(self.client_random).decode(),
-            "server_random": base64.b64encode(self.server_random).decode(),
-            "shared_key": base64.b64encode(self.shared_key).decode(),
+            "encryption_key": binascii.b2a_base64(self.encryption_key, newline=False).decode(),
+            "client_random": binascii.b2a_base64(self.client_random, newline=False).decode(),
+            "server_random": binascii.b2a_base64(self.server_random, newline=False).decode(),
+            "shared_key": binascii.b2a_base64(self.shared_key, newline=False).decode(),
             "ticket_exp": self.ticket_exp,
             "ticket_long_exp": self.ticket_long_exp,
             "expires_at": self.expires_at,
@@ -95,16 +122,20 @@ class WaveSession(BaseModel):
         return cls(
             ticket=data["ticket"],
             ticket_long=data["ticket_long"],
-            encryption_key=base64.b64decode(data["encryption_key"]),
-            client_random=base64.b64decode(data["client_random"]),
-            server_random=base64.b64decode(data["server_random"]),
-            shared_key=base64.b64decode(data["shared_key"]),
+            encryption_key=binascii.a2b_base64(data["encryption_key"]),
+            client_random=binascii.a2b_base64(data["client_random"]),
+            server_random=binascii.a2b_base64(data["server_random"]),
+            shared_key=binascii.a2b_base64(data["shared_key"]),
             ticket_exp=data["ticket_exp"],
             ticket_long_exp=data["ticket_long_exp"],
             expires_at=data["expires_at"],
         )
 
 
+# 绑定某个会话的加密请求函数：(明文, 额外请求头) -> (密文, 请求头)
+_PrepareFn = Callable[[bytes, Optional[dict]], tuple[bytes, dict]]
+
+
 class WaveClient:
     """
     Wave 协议客户端
@@ -121,28 +152,36 @@ class WaveClient:
         self.app_id = str(app_id)
         self.session = session
         self._on_session_update = on_session_update
+        # 独立的连接池：握手可能在其他线程中执行，不与模块级共享会话混用；
+        # 会话刷新时复用 keep-alive 连接，不必重新建立 TCP/TLS 连接
+        self._http = _http.new_session(pool_connections=1, pool_maxsize=1)
+        # (会话, 单调时钟下的过期时刻, 绑定该会话的加密函数)，会话对象变化时重建
+        self._session_state: Optional[tuple[WaveSession, float, _PrepareFn]] = None
 
     @staticmethod
     def _chacha20_crypt(key: bytes, nonce: bytes, data: bytes) -> bytes:
-        """ChaCha20 加密/解密"""
-        if len(nonce) == 12:
-            nonce_16 = b'\x00\x00\x00\x00' + nonce
-        else:
-            nonce_16 = nonce
-        cipher = Cipher(algorithms.ChaCha20(key, nonce_16), mode=None, backend=default_backend())
-        encryptor = cipher.encryptor()
-        return encryptor.update(data) + encryptor.finalize()
+        """
+        ChaCha20 加密/解密
+
+        :param nonce: 12 字节 IETF nonce（块计数器从 0 开始），或已带计数器的 16 字节
+        """
+        # cryptography 的 ChaCha20 只接受 16 字节的 "小端 32 位计数器 || 96 位 nonce"，
+        # 这里的 16 字节拼接无法省去
+        nonce_16 = _INITIAL_COUNTER + nonce if len(nonce) == 12 else nonce
+        # ChaCha20 是流密码，update 即返回全部输出，finalize 恒为空，无需再拼接一次；
+        # 实际运算由 OpenSSL 完成，会按 CPU 自动选用 SIMD 实现
+        return Cipher(algorithms.ChaCha20(key, nonce_16), mode=None).encryptor().update(data)
 
     @staticmethod
     def _derive_key(shared_key: bytes, salt: bytes, info: bytes) -> bytes:
-        """HKDF 密钥派生"""
-        return HKDF(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            info=info,
-            backend=default_backend()
-        ).derive(shared_key)
+        """
+        HKDF-SHA256 密钥派生，输出 32 字节
+
+        输出长度恰好等于一个 SHA256 块，按 RFC 5869 只需 extract + 一轮 expand，
+        直接用 hmac.digest 的 C 实现计算
+        """
+        prk = hmac.digest(salt, shared_key, "sha256")
+        return hmac.digest(prk, info + b"\x01", "sha256")
 
     def handshake(self) -> bool:
         """
@@ -151,7 +190,7 @@ class WaveClient:
         :return: 握手是否成功
         """
         # 生成 ECDH 密钥对
-        private_key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+        private_key = ec.generate_private_key(_CURVE)
         client_random = secrets.token_bytes(32)
 
         pubkey_bytes = private_key.public_key().public_bytes(
@@ -163,13 +202,13 @@ class WaveClient:
             random=base64.b64encode(client_random).decode(),
             app_id=self.app_id,
             did=self.device_id,
-            key_shares=[_KeyShare(curve="secp256r1", pubkey=base64.b64encode(pubkey_bytes).decode())],
+            pubkey=base64.b64encode(pubkey_bytes).decode(),
         )
 
-        request_json = request.model_dump_json(by_alias=True)
+        request_json = request.to_json()
 
         # ECDSA 签名
-        signature = private_key.sign(request_json.encode(), ec.ECDSA(hashes.SHA256()))
+        signature = private_key.sign(request_json, _ECDSA_SHA256)
 
         headers = {
             "Content-Type": "application/json",
@@ -177,17 +216,18 @@ class WaveClient:
             "User-Agent": USER_AGENT,
         }
 
-        response = requests.post(HANDSHAKE_URL, data=request_json, headers=headers)
+        response = self._http.post(HANDSHAKE_URL, data=request_json, headers=headers)
 
         if response.status_code != 200:
             return False
 
-        resp = _HandshakeResponse(**response.json())
+        # 直接从响应字节解析并校验，不经过中间 dict
+        resp = _HandshakeResponse.model_validate_json(response.content)
 
         # 计算共享密钥
         server_pubkey = base64.b64decode(resp.key_share.pubkey)
-        server_public_key = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256R1(), server_pubkey)
-        shared_key = private_key.exchange(ec.ECDH(), server_public_key)
+        server_public_key = ec.EllipticCurvePublicKey.from_encoded_point(_CURVE, server_pubkey)
+        shared_key = private_key.exchange(_ECDH, server_public_key)
         server_random = base64.b64decode(resp.random)
 
         # 派生加密密钥
@@ -213,11 +253,36 @@ class WaveClient:
         return True
 
     def _ensure_session(self) -> None:
-        """确保会话有效，如果过期则自动刷新"""
-        if self.session is None or self.session.is_expired():
+        """
+        确保会话有效，如果不存在或已过期则重新握手
+
+        :raises RuntimeError: 握手失败
+        """
+        if self._session_expired():
             if not self.handshake():
                 raise RuntimeError("Failed to establish/refresh session")
 
+    def _current_session_state(self) -> tuple[WaveSession, float, _PrepareFn]:
+        """
+        当前会话的派生状态，按会话对象缓存
+
+        会话可能由握手、构造参数或外部直接赋值替换，因此以对象身份判断是否需要重建
+        """
+        cached = self._session_state
+        session = self.session
+        if cached is None or cached[0] is not session:
+            # expires_at 是可持久化的墙上时间，进程内换算一次为单调时钟截止时刻，
+            # 之后的过期判断只是一次浮点比较，也不受系统时间调整影响
+            deadline = time.monotonic() + (session.expires_at - time.time())
+            cached = self._session_state = (session, deadline, _build_prepare(session))
+        return cached
+
+    def _session_expired(self) -> bool:
+        """当前会话是否不存在或已过期"""
+        if self.session is None:
+            return True
+        return time.monotonic() >= self._current_session_state()[1]
+
     def prepare_request(self, plaintext: bytes, extra_headers: Optional[dict] = None) -> tuple[bytes, dict]:
         """
         准备加密请求
@@ -227,23 +292,7 @@ class WaveClient:
         :return: (密文, headers) 元组
         """
         self._ensure_session()
-
-        nonce = secrets.token_bytes(12)
-        ciphertext = self._chacha20_crypt(self.session.encryption_key, nonce, plaintext)
-        stub = hashlib.md5(ciphertext).hexdigest().upper()
-
-        headers = {
-            "Content-Type": "application/json",
-            "x-tt-e-b": "1",
-            "x-tt-e-t": self.session.ticket,
-            "x-tt-e-p": base64.b64encode(nonce).decode(),
-            "x-ss-stub": stub,
-        }
-
-        if extra_headers:
-            headers.update(extra_headers)
-
-        return ciphertext, headers
+        return self._current_session_state()[2](plaintext, extra_headers)
 
     def decrypt(self, ciphertext: bytes, nonce: bytes) -> bytes:
         """
@@ -257,3 +306,35 @@ class WaveClient:
             raise RuntimeError("No active session. Call handshake() first.")
 
         return self._chacha20_crypt(self.session.encryption_key, nonce, ciphertext)
+
+
+def _build_prepare(session: WaveSession) -> _PrepareFn:
+    """
+    为会话构建专用的加密请求函数
+
+    密钥和固定请求头在会话内不变，提前绑定到闭包中，每次请求只需处理随明文变化的部分
+    """
+    key = session.encryption_key
+    template = {
+        "Content-Type": "application/json",
+        "x-tt-e-b": "1",
+        "x-tt-e-t": session.ticket,
+    }
+    crypt = WaveClient._chacha20_crypt
+
+    def prepare(plaintext: bytes, extra_headers: Optional[dict] = None) -> tuple[bytes, dict]:
+        # 每个请求必须使用新的随机 nonce，密钥流不能跨请求预生成或复用
+        nonce = secrets.token_bytes(12)
+        ciphertext = crypt(key, nonce, plaintext)
+
+        headers = template.copy()
+        headers["x-tt-e-p"] = binascii.b2a_base64(nonce, newline=False).decode()
+        # x-ss-stub 只是请求体摘要，不用于安全用途；FIPS 环境下也不会被拒绝
+        headers["x-ss-stub"] = hashlib.md5(ciphertext, usedforsecurity=False).hexdigest().upper()
+
+        if extra_headers:
+            headers.update(extra_headers)
+
+        return ciphertext, headers
+
+    return prepare
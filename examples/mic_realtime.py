@@ -1,9 +1,10 @@
 """
 麦克风实时语音识别示例
 
-依赖: pip install sounddevice numpy
+依赖: pip install sounddevice
 """
 import asyncio
+from collections import deque
 
 from doubaoime_asr.asr import transcribe_realtime, ResponseType
 from doubaoime_asr.config import ASRConfig
@@ -20,36 +21,43 @@ async def mic_audio_generator(
     使用 sounddevice 从麦克风读取音频数据，通过回调模式避免阻塞事件循环
     """
     import sounddevice as sd
-    import numpy as np
 
     # 每帧样本数
     samples_per_frame = sample_rate * frame_duration_ms // 1000
 
-    # 使用 asyncio.Queue 在回调和异步生成器之间传递数据
-    queue: asyncio.Queue[bytes] = asyncio.Queue()
+    # 回调线程只向 deque 追加数据（append/popleft 线程安全），
+    # 仅在消费者等待时才通过事件循环唤醒它，而不是每帧都投递一次回调
+    chunks: deque[bytes] = deque()
+    ready = asyncio.Event()
     loop = asyncio.get_event_loop()
 
     def audio_callback(indata, frames, time_info, status):
         """sounddevice 回调函数（在单独线程中运行）"""
         if status:
             print(f"[Mic] 状态: {status}")
-        # 将数据放入队列（线程安全）
-        loop.call_soon_threadsafe(queue.put_nowait, indata.tobytes())
+        # RawInputStream 直接给出原始 PCM 缓冲区，回调返回后会被复用，
+        # 这里拷贝一次为 bytes 放入队列，无需经过 numpy 数组
+        chunks.append(bytes(indata))
+        if not ready.is_set():
+            loop.call_soon_threadsafe(ready.set)
 
     print(f"[Mic] 开始录音 (按 Ctrl+C 停止)...")
     print(f"[Mic] 采样率: {sample_rate}Hz, 声道: {channels}, 帧时长: {frame_duration_ms}ms")
 
-    with sd.InputStream(
+    with sd.RawInputStream(
         samplerate=sample_rate,
         channels=channels,
-        dtype=np.int16,
+        dtype="int16",
         blocksize=samples_per_frame,
         callback=audio_callback,
     ):
         while True:
-            # 异步等待音频数据
-            data = await queue.get()
-            yield data
+            # 异步等待音频数据，被唤醒后一次取完已积累的所有帧；
+            # 先 clear 再取数据，保证之后追加的帧一定会再次触发唤醒
+            await ready.wait()
+            ready.clear()
+            while chunks:
+                yield chunks.popleft()
 
 
 async def main():
@@ -0,0 +1,30 @@
+import pytest
+
+from doubaoime_asr.asr import DoubaoASR
+from doubaoime_asr.config import ASRConfig
+
+
+class FakeOpusEncoder:
+    """
+    代替 opuslib.Encoder，"编码"结果即输入的 PCM 本身，便于断言帧内容
+    """
+    def __init__(self) -> None:
+        self.calls: list[tuple[bytes, int]] = []
+
+    def encode(self, pcm: bytes, frame_size: int) -> bytes:
+        assert type(pcm) is bytes  # opuslib 只接受 bytes
+        self.calls.append((pcm, frame_size))
+        return pcm
+
+
+@pytest.fixture
+def config() -> ASRConfig:
+    # 直接给出凭据，不触发设备注册等网络请求
+    return ASRConfig(device_id="1234567890123456", token="token")
+
+
+@pytest.fixture
+def asr(config: ASRConfig) -> DoubaoASR:
+    client = DoubaoASR(config)
+    client._encoder._encoder = FakeOpusEncoder()
+    return client
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from doubaoime_asr.asr import _build_asr_request, _new_task_request_template
+from doubaoime_asr.asr_pb2 import AsrRequest, FrameState
+
+
+REQUEST_ID = "3f1c2a9e-5b7d-4e8a-9c6f-0d1e2f3a4b5c"
+
+
+@pytest.mark.parametrize("frame_state", [
+    FrameState.FRAME_STATE_UNSPECIFIED,
+    FrameState.FRAME_STATE_FIRST,
+    FrameState.FRAME_STATE_MIDDLE,
+    FrameState.FRAME_STATE_LAST,
+])
+@pytest.mark.parametrize("audio_data", [
+    b"",
+    b"\x01\x02\x03",
+    bytes(range(256)) * 4,  # 长度超过 127，varint 需要多个字节
+])
+@pytest.mark.parametrize("timestamp_ms", [0, 1_700_000_000_000])
+def test_build_asr_request_matches_protobuf(frame_state, audio_data, timestamp_ms):
+    template = _new_task_request_template(REQUEST_ID)
+    data = _build_asr_request(template, audio_data, frame_state, timestamp_ms)
+
+    payload = AsrRequest.FromString(data).payload
+    assert json.loads(payload) == {"extra": {}, "timestamp_ms": timestamp_ms}
+
+    expected = AsrRequest(
+        service_name="ASR",
+        method_name="TaskRequest",
+        payload=payload,
+        audio_data=audio_data,
+        request_id=REQUEST_ID,
+        frame_state=frame_state,
+    ).SerializeToString()
+    assert data == expected
@@ -0,0 +1,97 @@
+import json
+import os
+
+import pytest
+
+from doubaoime_asr import config as config_module
+from doubaoime_asr.config import ASRConfig
+from doubaoime_asr.device import DeviceCredentials
+from doubaoime_asr.wave_client import WaveSession
+
+
+@pytest.fixture
+def cred_config(tmp_path, monkeypatch):
+    path = tmp_path / "creds" / "credentials.json"
+    cfg = ASRConfig(credential_path=str(path), device_id="1", token="t")
+    cfg._credentials = DeviceCredentials(device_id="1", token="t")
+    cfg._initialized = True
+
+    replaces = []
+    real_replace = os.replace
+
+    def recording_replace(src, dst):
+        replaces.append((str(src), str(dst)))
+        real_replace(src, dst)
+
+    monkeypatch.setattr(config_module.os, "replace", recording_replace)
+    return cfg, path, replaces
+
+
+def _wave_session() -> WaveSession:
+    return WaveSession(
+        ticket="ticket",
+        ticket_long="ticket_long",
+        encryption_key=b"k" * 32,
+        client_random=b"c" * 32,
+        server_random=b"s" * 32,
+        shared_key=b"x" * 32,
+        ticket_exp=3600,
+        ticket_long_exp=7200,
+        expires_at=1e10,
+    )
+
+
+def _update_both(cfg: ASRConfig) -> None:
+    # 与 ner() 中 wave 会话和 sami_token 同时刷新的情况相同
+    cfg._on_wave_session_update(_wave_session())
+    cfg._credentials.sami_token = "sami"
+    cfg._update_credentials_file()
+
+
+def test_private_state_is_not_a_constructor_argument():
+    with pytest.raises(TypeError):
+        ASRConfig(_save_deferred=1)
+    with pytest.raises(TypeError):
+        ASRConfig(_save_pending=True)
+
+
+def test_updates_without_deferral_write_each_time(cred_config):
+    cfg, path, replaces = cred_config
+    _update_both(cfg)
+    assert len(replaces) == 2
+
+
+def test_deferred_save_writes_once_atomically(cred_config):
+    cfg, path, replaces = cred_config
+
+    with cfg._deferred_save():
+        _update_both(cfg)
+        with cfg._deferred_save():  # 嵌套时只在最外层退出时写入
+            cfg._update_credentials_file()
+        assert replaces == []
+        assert not path.exists()
+
+    assert replaces == [(str(path) + ".tmp", str(path))]
+    assert not os.path.exists(str(path) + ".tmp")
+    saved = json.loads(path.read_text())
+    assert saved["sami_token"] == "sami"
+    assert saved["wave_session"]["ticket"] == "ticket"
+
+
+def test_deferred_save_writes_on_exception(cred_config):
+    cfg, path, replaces = cred_config
+
+    with pytest.raises(RuntimeError):
+        with cfg._deferred_save():
+            _update_both(cfg)
+            raise RuntimeError("handshake failed")
+
+    assert len(replaces) == 1
+    assert json.loads(path.read_text())["sami_token"] == "sami"
+
+
+def test_deferred_save_without_updates_does_not_write(cred_config):
+    cfg, path, replaces = cred_config
+    with cfg._deferred_save():
+        pass
+    assert replaces == []
@@ -0,0 +1,18 @@
+from http.client import HTTPMessage
+
+import requests
+from requests.cookies import MockRequest, MockResponse
+
+from doubaoime_asr import _http
+
+
+def test_session_does_not_store_cookies():
+    headers = HTTPMessage()
+    headers["Set-Cookie"] = "sessionid=abc; Path=/"
+    request = requests.Request("POST", "https://example.com/").prepare()
+
+    session = _http.new_session()
+    session.cookies.extract_cookies(MockResponse(headers), MockRequest(request))
+
+    assert len(session.cookies) == 0
+    assert len(_http.session.cookies) == 0
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import pytest
+import websockets
+
+from doubaoime_asr.asr import ASRResponse, ResponseType, _IdleTimer, _ResponseChannel
+
+
+def _resp(text: str) -> ASRResponse:
+    return ASRResponse(type=ResponseType.INTERIM_RESULT, text=text)
+
+
+@pytest.mark.asyncio
+async def test_timer_fires_only_while_waiting():
+    channel = _ResponseChannel()
+    timer = _IdleTimer(0.05, channel)
+    try:
+        # 不在等待状态时，超过超时时间也不关闭通道
+        await asyncio.sleep(0.12)
+        channel.put(_resp("a"))
+        assert await channel.wait()
+        channel.popleft()
+
+        timer.start_waiting()
+        start = time.monotonic()
+        # 超时后通道关闭，wait 返回 False 作为结束标记
+        assert await asyncio.wait_for(channel.wait(), 1) is False
+        assert time.monotonic() - start >= 0.04
+    finally:
+        timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_timer_rearms_with_remaining_time():
+    channel = _ResponseChannel()
+    timer = _IdleTimer(0.1, channel)
+    try:
+        await asyncio.sleep(0.06)
+        # 定时器在 0.1s 时触发，此时只等待了约 0.04s，应按剩余时间重新挂载
+        timer.start_waiting()
+        start = time.monotonic()
+        assert await asyncio.wait_for(channel.wait(), 1) is False
+        assert time.monotonic() - start >= 0.09
+    finally:
+        timer.cancel()
+
+
+@pytest.mark.asyncio
+async def test_timer_restarts_after_response():
+    channel = _ResponseChannel()
+    timer = _IdleTimer(0.05, channel)
+
+    async def produce():
+        await asyncio.sleep(0.03)
+        channel.put(_resp("a"))
+
+    try:
+        producer = asyncio.create_task(produce())
+        timer.start_waiting()
+        assert await channel.wait()
+        timer.stop_waiting()
+        await producer
+        channel.popleft()
+
+        # 收到响应后重新计时：再次等待满一个超时时间才结束
+        timer.start_waiting()
+        start = time.monotonic()
+        assert await asyncio.wait_for(channel.wait(), 1) is False
+        assert time.monotonic() - start >= 0.04
+    finally:
+        timer.cancel()
+
+
+class _FakeConnection:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+@pytest.mark.parametrize("recv_timeout, expected", [
+    (0.03, []),            # 响应晚于超时到达，会话因超时结束
+    (None, ["late"]),      # 不设超时时一直等待到响应到达
+])
+@pytest.mark.asyncio
+async def test_transcribe_stream_recv_timeout(monkeypatch, asr, recv_timeout, expected):
+    asr.config.recv_timeout = recv_timeout
+    monkeypatch.setattr(websockets, "connect", lambda *args, **kwargs: _FakeConnection())
+
+    async def initialize_session(ws, state):
+        return
+        yield
+
+    async def send_audio(ws, opus_frames, state, realtime):
+        return None
+
+    async def receive_responses(ws, state, responses):
+        await asyncio.sleep(0.1)
+        responses.put(_resp("late"))
+        responses.close()
+
+    monkeypatch.setattr(asr, "_initialize_session", initialize_session)
+    monkeypatch.setattr(asr, "_send_audio", send_audio)
+    monkeypatch.setattr(asr, "_receive_responses", receive_responses)
+
+    texts = [resp.text async for resp in asr.transcribe_stream(b"")]
+    assert texts == expected
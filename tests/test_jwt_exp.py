@@ -0,0 +1,59 @@
+import base64
+import json
+
+import pytest
+
+from doubaoime_asr.config import _jwt_exp
+
+
+def _token(payload: bytes) -> str:
+    # JWT 使用不带 padding 的 base64url
+    body = base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{body}.signature"
+
+
+@pytest.mark.parametrize("padding", [0, 2, 3])
+def test_each_padding_length(padding):
+    # 调整 payload 长度，使去掉 padding 后的 base64 长度 % 4 依次为 0、2、3
+    for filler in range(8):
+        payload = json.dumps({"exp": 1700000000, "f": "x" * filler}).encode()
+        body = _token(payload).split(".")[1]
+        if len(body) % 4 == padding:
+            break
+    else:
+        pytest.fail("no payload with the requested padding length")
+
+    assert _jwt_exp(_token(payload)) == 1700000000
+
+
+def test_urlsafe_characters():
+    # "~~~" / "???" 编码后分别包含 "-" 和 "_"（标准 base64 中为 "+" 和 "/"）
+    for text in ("~~~", "???"):
+        token = _token(json.dumps({"exp": 42, "s": text}).encode())
+        body = token.split(".")[1]
+        assert "-" in body or "_" in body
+        assert _jwt_exp(token) == 42
+
+
+def test_missing_exp():
+    assert _jwt_exp(_token(b'{"sub":"user"}')) is None
+
+
+@pytest.mark.parametrize("token", [
+    "",
+    "no-dots-at-all",
+    "header.!!!!.signature",
+    "header.a.signature",                   # base64 长度非法
+    _token(b"not json"),
+    _token(b"[1, 2, 3]"),                   # payload 不是对象
+])
+def test_malformed_tokens_return_none(token):
+    assert _jwt_exp(token) is None
+
+
+def test_result_is_cached():
+    _jwt_exp.cache_clear()
+    token = _token(b'{"exp": 7}')
+    assert _jwt_exp(token) == 7
+    assert _jwt_exp(token) == 7
+    assert _jwt_exp.cache_info().hits == 1
@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from doubaoime_asr.asr import ResponseType, _is_obvious_heartbeat, _parse_response
+from doubaoime_asr.asr_pb2 import AsrResponse
+
+
+def _response(result_json: str = "", message_type: str = "", status_message: str = "") -> bytes:
+    return AsrResponse(
+        message_type=message_type,
+        status_message=status_message,
+        result_json=result_json,
+    ).SerializeToString()
+
+
+def test_heartbeat_fast_path():
+    result_json = '{"extra":{"packet_number":3}}'
+    assert _is_obvious_heartbeat(result_json)
+    resp = _parse_response(_response(result_json))
+    assert resp.type == ResponseType.HEARTBEAT
+
+
+def test_heartbeat_shape_matches_decoded_path():
+    fast = _parse_response(_response('{"extra":{"packet_number":3}}'))
+    decoded = _parse_response(_response('{"results":null,"extra":{"packet_number":3}}'))
+    assert fast == decoded
+
+
+@pytest.mark.parametrize("result_json", [
+    '{"extra":{"packet_number":3}',        # 缺少右括号
+    '{"extra":{"packet_number":3}} trailing',
+    'not json',
+])
+def test_malformed_json_is_unknown(result_json):
+    assert not _is_obvious_heartbeat(result_json)
+    assert _parse_response(_response(result_json)).type == ResponseType.UNKNOWN
+
+
+@pytest.mark.parametrize("result_json", [
+    '{"code":1001,"message":"bad request"}',
+    '{"error":"internal"}',
+    '{"err_msg":"internal"}',
+])
+def test_error_markers_skip_fast_path(result_json):
+    assert not _is_obvious_heartbeat(result_json)
+    # 带错误标记的内容一定经过 JSON 解析，格式异常时不会被当作心跳包丢弃
+    assert _parse_response(_response(result_json[:-1])).type == ResponseType.UNKNOWN
+
+
+def test_large_payload_skips_fast_path():
+    result_json = json.dumps({"extra": {"padding": "x" * 300}})
+    assert not _is_obvious_heartbeat(result_json)
+    assert _parse_response(_response(result_json[:-1])).type == ResponseType.UNKNOWN
+
+
+def test_interim_result():
+    result_json = json.dumps({"results": [{"text": "你好", "is_interim": True}], "extra": {}})
+    resp = _parse_response(_response(result_json))
+    assert resp.type == ResponseType.INTERIM_RESULT
+    assert resp.text == "你好"
+
+
+def test_task_failed_is_error():
+    resp = _parse_response(_response(message_type="TaskFailed", status_message="boom"))
+    assert resp.type == ResponseType.ERROR
+    assert resp.error_msg == "boom"
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from doubaoime_asr.asr import ASRResponse, ResponseType, _ResponseChannel
+
+
+def _resp(text: str) -> ASRResponse:
+    return ASRResponse(type=ResponseType.INTERIM_RESULT, text=text)
+
+
+@pytest.mark.asyncio
+async def test_channel_keeps_fifo_order():
+    channel = _ResponseChannel()
+    for text in ("a", "b", "c"):
+        channel.put(_resp(text))
+    channel.close()
+
+    texts = []
+    while await channel.wait():
+        texts.append(channel.popleft().text)
+    # 关闭前放入的响应仍按顺序取出，取完后才报告结束
+    assert texts == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_channel_wakes_waiting_consumer():
+    channel = _ResponseChannel()
+
+    async def produce():
+        for text in ("a", "b"):
+            await asyncio.sleep(0.01)
+            channel.put(_resp(text))
+        await asyncio.sleep(0.01)
+        channel.close()
+
+    producer = asyncio.create_task(produce())
+    texts = []
+    while await asyncio.wait_for(channel.wait(), 1):
+        texts.append(channel.popleft().text)
+    await producer
+    assert texts == ["a", "b"]
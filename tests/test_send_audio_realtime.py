@@ -0,0 +1,158 @@
+import asyncio
+
+import pytest
+
+from doubaoime_asr.asr import _SessionState
+from doubaoime_asr.asr_pb2 import AsrRequest, FrameState
+
+
+FINISH = b"finish-session"
+
+
+class _RecordingConnection:
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    async def send(self, message: bytes) -> None:
+        self.sent.append(message)
+
+
+async def _source(chunks, error: Exception = None):
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+    if error is not None:
+        raise error
+
+
+def _state() -> _SessionState:
+    return _SessionState(finish_session_bytes=FINISH)
+
+
+def _frames(sent: list[bytes]) -> list[tuple[int, bytes]]:
+    """解析已发送的 TaskRequest，返回 (frame_state, audio_data) 列表"""
+    assert sent[-1] == FINISH
+    frames = []
+    for message in sent[:-1]:
+        request = AsrRequest.FromString(message)
+        assert request.method_name == "TaskRequest"
+        frames.append((request.frame_state, request.audio_data))
+    return frames
+
+
+def _pcm(size: int, seed: int = 0) -> bytes:
+    return bytes((seed + i) % 251 for i in range(size))
+
+
+async def _run(asr, chunks, error: Exception = None) -> list[bytes]:
+    ws = _RecordingConnection()
+    await asr._send_audio_realtime(ws, _source(chunks, error), _state())
+    return ws.sent
+
+
+@pytest.mark.asyncio
+async def test_frame_aligned_chunks(asr):
+    bpf = asr.config.bytes_per_frame
+    chunks = [_pcm(bpf, 1), _pcm(2 * bpf, 2)]
+    frames = _frames(await _run(asr, chunks))
+
+    assert [state for state, _ in frames] == [
+        FrameState.FRAME_STATE_FIRST,
+        FrameState.FRAME_STATE_MIDDLE,
+        FrameState.FRAME_STATE_MIDDLE,
+        FrameState.FRAME_STATE_LAST,
+    ]
+    assert b"".join(audio for _, audio in frames[:-1]) == b"".join(chunks)
+    # 没有剩余数据时以一帧静音作为 LAST 帧
+    assert frames[-1][1] == bytes(bpf)
+
+
+@pytest.mark.asyncio
+async def test_unaligned_chunks(asr):
+    bpf = asr.config.bytes_per_frame
+    chunks = [_pcm(bpf + 100, 1), _pcm(bpf - 30, 2), _pcm(50, 3)]
+    pcm = b"".join(chunks)
+    frames = _frames(await _run(asr, chunks))
+
+    full, tail = divmod(len(pcm), bpf)
+    assert [state for state, _ in frames] == (
+        [FrameState.FRAME_STATE_FIRST]
+        + [FrameState.FRAME_STATE_MIDDLE] * (full - 1)
+        + [FrameState.FRAME_STATE_LAST]
+    )
+    # 不足一帧的剩余数据补零后作为 LAST 帧发送
+    assert b"".join(audio for _, audio in frames) == pcm + bytes(bpf - tail)
+    assert all(len(audio) == bpf for _, audio in frames)
+
+
+@pytest.mark.parametrize("wrap", [bytearray, memoryview, lambda b: memoryview(b).cast("h")])
+@pytest.mark.asyncio
+async def test_buffer_inputs_match_bytes(asr, wrap):
+    bpf = asr.config.bytes_per_frame
+    chunks = [_pcm(bpf + 100, 1), _pcm(2 * bpf - 100, 2), _pcm(300, 3)]
+    expected = await _run(asr, chunks)
+
+    sent = await _run(asr, [wrap(chunk) for chunk in chunks])
+    assert _frames(sent) == _frames(expected)
+
+
+@pytest.mark.asyncio
+async def test_empty_source(asr):
+    sent = await _run(asr, [])
+    # 没有任何音频时不发送音频帧，只结束会话
+    assert sent == [FINISH]
+
+
+@pytest.mark.asyncio
+async def test_source_error_propagates(asr):
+    bpf = asr.config.bytes_per_frame
+    ws = _RecordingConnection()
+    source = _source([_pcm(bpf, 1), _pcm(10, 2)], RuntimeError("mic unplugged"))
+
+    with pytest.raises(RuntimeError, match="mic unplugged"):
+        await asr._send_audio_realtime(ws, source, _state())
+
+    # 出错前凑满的帧已经发出，但不会发送 LAST 帧和 FinishSession
+    assert [AsrRequest.FromString(m).frame_state for m in ws.sent] == [FrameState.FRAME_STATE_FIRST]
+
+
+@pytest.mark.asyncio
+async def test_collect_pcm_ends_with_none_and_returns_tail(asr):
+    bpf = asr.config.bytes_per_frame
+    queue: asyncio.Queue = asyncio.Queue()
+    chunks = [_pcm(bpf // 2, 1), _pcm(bpf, 2)]
+
+    tail = await asr._collect_pcm(_source(chunks), _state(), queue)
+
+    items = [queue.get_nowait() for _ in range(queue.qsize())]
+    assert items == [b"".join(chunks)[:bpf], None]
+    assert tail == b"".join(chunks)[bpf:]
+
+
+@pytest.mark.asyncio
+async def test_collect_pcm_applies_backpressure(asr):
+    bpf = asr.config.bytes_per_frame
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    chunks = [_pcm(bpf, i) for i in range(3)]
+    task = asyncio.create_task(asr._collect_pcm(_source(chunks), _state(), queue))
+
+    # 队列已满时读取端挂起，不会继续消费音频源
+    await asyncio.sleep(0.05)
+    assert not task.done()
+    assert queue.full()
+
+    items = [await queue.get() for _ in range(4)]
+    assert items == chunks + [None]
+    await task
+
+
+@pytest.mark.asyncio
+async def test_collect_pcm_error_wakes_consumer_when_queue_full(asr):
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    queue.put_nowait(b"pending")
+
+    with pytest.raises(RuntimeError):
+        await asr._collect_pcm(_source([], RuntimeError("boom")), _state(), queue)
+
+    # 队列满时腾出位置放入结束标记，发送端不会一直阻塞
+    assert queue.get_nowait() is None
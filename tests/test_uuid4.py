@@ -0,0 +1,27 @@
+import uuid
+
+import pytest
+
+from doubaoime_asr import device
+from doubaoime_asr.device import _uuid4_str
+
+
+def _assert_canonical_v4(s: str) -> None:
+    parsed = uuid.UUID(s, version=4)
+    # UUID(version=4) 会强制改写版本和变体位，只有本身合法时 str 才能原样还原
+    assert str(parsed) == s
+    assert parsed.version == 4
+    assert parsed.variant == uuid.RFC_4122
+
+
+def test_round_trips_as_uuid4():
+    values = {_uuid4_str() for _ in range(1000)}
+    assert len(values) == 1000
+    for s in values:
+        _assert_canonical_v4(s)
+
+
+@pytest.mark.parametrize("raw", [bytes(16), b"\xff" * 16, bytes(range(16))])
+def test_version_and_variant_bits_are_forced(monkeypatch, raw):
+    monkeypatch.setattr(device.secrets, "token_bytes", lambda n: raw)
+    _assert_canonical_v4(_uuid4_str())